@@ -59,16 +59,17 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 REST_FRAMEWORK = {
-    # Use Token authentication as default
+    # Session auth for the browsable API, Token auth for clients
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'rest_framework.authentication.SessionAuthentication',  # علشان يظهر زرار Login
+        'rest_framework.authentication.TokenAuthentication',    # علشان تقدر تستخدم التوكينات
     ],
     # Require authentication by default for all views
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    # Enable pagination
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # Enable pagination (with cached per-user counts)
+    'DEFAULT_PAGINATION_CLASS': 'tasks.pagination.CachedCountPagination',
     'PAGE_SIZE': 10,
     # Enable filtering
     'DEFAULT_FILTER_BACKENDS': [
@@ -76,9 +77,9 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    # JSON renderer as default
+    # Fast orjson-based JSON renderer as default
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'tasks.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 }
@@ -96,13 +97,6 @@ X_FRAME_OPTIONS = 'DENY'
 
 ROOT_URLCONF = 'task_api.urls'
 
-REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.SessionAuthentication',  # علشان يظهر زرار Login
-        'rest_framework.authentication.TokenAuthentication',    # علشان تقدر تستخدم التوكينات
-    ],
-}
-
 
 TEMPLATES = [
     {
@@ -133,6 +127,21 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Task statistics and list counts are cached for 30 seconds and invalidated
+# on writes. LocMemCache is per-process, so with several workers the
+# invalidation only reaches the worker that handled the write and others
+# may serve stale values until the entry expires. Use a shared backend
+# (e.g. Redis or Memcached) in multi-worker deployments.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
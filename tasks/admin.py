@@ -1,5 +1,7 @@
 from django.contrib import admin
+from django.utils import timezone
 from .models import Task
+from .signals import invalidate_task_stats
 
 
 @admin.register(Task)
@@ -13,6 +15,12 @@ class TaskAdmin(admin.ModelAdmin):
         'due_date', 'created_at', 'updated_at'
     ]
     
+    # Join the owner when building the change list
+    list_select_related = ('user',)
+    
+    # Search users instead of loading them all into a dropdown
+    autocomplete_fields = ['user']
+    
     # Fields that can be used to filter the list
     list_filter = ['status', 'created_at', 'due_date', 'user']
     
@@ -48,11 +56,26 @@ class TaskAdmin(admin.ModelAdmin):
     # Enable actions
     actions = ['mark_as_completed', 'mark_as_pending']
     
+    def update_status(self, queryset, status):
+        """
+        Set the status of the selected tasks with a single UPDATE,
+        without loading the rows
+        """
+        user_ids = set(
+            queryset.order_by().values_list('user_id', flat=True).distinct()
+        )
+        # update() bypasses auto_now, so set updated_at explicitly
+        updated = queryset.update(status=status, updated_at=timezone.now())
+        # Bulk updates bypass signals, so invalidate cached stats manually
+        for user_id in user_ids:
+            invalidate_task_stats(user_id)
+        return updated
+    
     def mark_as_completed(self, request, queryset):
         """
         Custom admin action to mark selected tasks as completed
         """
-        updated = queryset.update(status='completed')
+        updated = self.update_status(queryset, 'completed')
         self.message_user(
             request,
             f'{updated} task(s) marked as completed.'
@@ -63,7 +86,7 @@ class TaskAdmin(admin.ModelAdmin):
         """
         Custom admin action to mark selected tasks as pending
         """
-        updated = queryset.update(status='pending')
+        updated = self.update_status(queryset, 'pending')
         self.message_user(
             request,
             f'{updated} task(s) marked as pending.'
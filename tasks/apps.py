@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
-    verbose_name = 'Task Management'
\ No newline at end of file
+    verbose_name = 'Task Management'
+
+    def ready(self):
+        # Register signal handlers for cache invalidation
+        from . import signals  # noqa: F401
\ No newline at end of file
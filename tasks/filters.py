@@ -0,0 +1,32 @@
+import django_filters
+from django.db.models import Q
+from django.utils import timezone
+from .models import Task
+
+
+def overdue_q():
+    """
+    Build the condition for overdue tasks: pending and past their due date
+    """
+    return Q(due_date__lt=timezone.now(), status='pending')
+
+
+class TaskFilter(django_filters.FilterSet):
+    """
+    FilterSet for Task list queries, including a computed overdue filter
+    """
+    overdue = django_filters.BooleanFilter(
+        method='filter_overdue',
+        label='Overdue'
+    )
+    
+    class Meta:
+        model = Task
+        fields = ['status', 'due_date', 'overdue']
+    
+    def filter_overdue(self, queryset, name, value):
+        """
+        Keep only pending tasks past their due date (or exclude them)
+        """
+        overdue = overdue_q()
+        return queryset.filter(overdue) if value else queryset.exclude(overdue)
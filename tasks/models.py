@@ -65,8 +65,16 @@ class Task(models.Model):
         ordering = ['-created_at']
         # Add database indexes for better query performance
         indexes = [
-            models.Index(fields=['user', 'status']),
+            # Also covers (user, status) lookups and serves the overdue query
+            models.Index(
+                fields=['user', 'status', 'due_date'],
+                name='task_user_status_due_idx'
+            ),
             models.Index(fields=['due_date']),
+            # Per-user indexes matching the API's ordering fields
+            models.Index(fields=['user', '-created_at'], name='task_user_created_idx'),
+            models.Index(fields=['user', '-updated_at'], name='task_user_updated_idx'),
+            models.Index(fields=['user', 'due_date'], name='task_user_due_idx'),
         ]
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
@@ -84,6 +92,11 @@ class Task(models.Model):
                 raise ValidationError({'due_date': 'Due date cannot be in the past.'})
     
     def save(self, *args, **kwargs):
-        """Override save to perform full validation"""
-        self.full_clean()
+        """
+        Override save to optionally perform full validation.
+        Serializers and admin forms already validate, so full_clean()
+        only runs when explicitly requested with validate=True.
+        """
+        if kwargs.pop('validate', False):
+            self.full_clean()
         super().save(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,82 @@
+import hashlib
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.utils.http import urlencode
+from django.core.cache import cache
+from rest_framework.pagination import PageNumberPagination
+from .signals import task_count_cache_key, TASK_COUNT_CACHE_TIMEOUT
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Django paginator that reads the total count from the cache
+    instead of running COUNT(*) on every page request.
+    An optional `annotate_page` callable is applied to the page slice only,
+    so annotations (and their joins) stay out of the count query.
+    """
+    def __init__(self, *args, count_cache_key=None, annotate_page=None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.annotate_page = annotate_page
+    
+    @cached_property
+    def count(self):
+        """Return the cached total count, computing it on a miss"""
+        if self.count_cache_key is None:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.count_cache_key, count, TASK_COUNT_CACHE_TIMEOUT)
+        return count
+    
+    def _get_page(self, object_list, *args, **kwargs):
+        """Build the page, annotating just the sliced rows"""
+        if self.annotate_page is not None:
+            object_list = self.annotate_page(object_list)
+        return super()._get_page(object_list, *args, **kwargs)
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page number pagination with per-user cached counts.
+    Counts are keyed by the user, the endpoint and its filter parameters,
+    and are invalidated by the Task signals. Views may define
+    `annotate_page(queryset)` to annotate only the rows of each page.
+    """
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_cache_key = self.get_count_cache_key(request, view)
+        self.annotate_page = getattr(view, 'annotate_page', None)
+        return super().paginate_queryset(queryset, request, view)
+    
+    def django_paginator_class(self, queryset, page_size):
+        """Build the paginator used by paginate_queryset()"""
+        return CachedCountPaginator(
+            queryset, page_size,
+            count_cache_key=self.count_cache_key,
+            annotate_page=self.annotate_page
+        )
+    
+    def get_count_cache_key(self, request, view=None):
+        """
+        Build the count cache key for the request, ignoring parameters
+        that only select a page. Returns None (no caching) for overdue
+        queries, since tasks become overdue without any write to
+        invalidate the cached count.
+        """
+        if not request.user.is_authenticated:
+            return None
+        if getattr(view, 'action', None) == 'overdue':
+            return None
+        if 'overdue' in request.query_params:
+            return None
+        params = request.query_params.copy()
+        params.pop(self.page_query_param, None)
+        if self.page_size_query_param:
+            params.pop(self.page_size_query_param, None)
+        query = urlencode(sorted(params.lists()), doseq=True)
+        filters = f'{request.path}?{query}'
+        filters_hash = hashlib.md5(filters.encode()).hexdigest()
+        return task_count_cache_key(request.user.id, filters_hash)
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.contrib.auth import authenticate
 from rest_framework.authtoken.models import Token
 from .models import Task
 from django.utils import timezone
+from django.db import transaction
+from django.db.models import Q
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -11,7 +14,8 @@ class TaskSerializer(serializers.ModelSerializer):
     Serializer for Task model with all fields and custom validation
     """
     # Read-only field to show username instead of user ID
-    username = serializers.CharField(source='user.username', read_only=True)
+    # (provided as an annotation by TaskViewSet.get_queryset)
+    username = serializers.CharField(read_only=True)
     
     class Meta:
         model = Task
@@ -73,21 +77,19 @@ class UserSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'first_name': {'required': False},
             'last_name': {'required': False},
+            # Uniqueness is checked in validate() together with email
+            'username': {'validators': [UnicodeUsernameValidator()]},
         }
     
     def validate_email(self, value):
         """
-        Check that the email is unique
+        Normalize the email (uniqueness is checked in validate())
         """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                "A user with this email already exists."
-            )
         return value.lower()  # Store emails in lowercase
     
     def validate_username(self, value):
         """
-        Validate username format and uniqueness
+        Validate username format
         """
         if not value.isalnum() and '_' not in value:
             raise serializers.ValidationError(
@@ -97,12 +99,24 @@ class UserSerializer(serializers.ModelSerializer):
     
     def validate(self, data):
         """
-        Check that the passwords match
+        Check that the passwords match and that the username and email
+        are not already taken, using a single query for both
         """
+        errors = {}
         if data.get('password') != data.get('password_confirm'):
-            raise serializers.ValidationError({
-                'password_confirm': "Passwords do not match."
-            })
+            errors['password_confirm'] = "Passwords do not match."
+        
+        existing = User.objects.filter(
+            Q(email__iexact=data['email']) | Q(username=data['username'])
+        ).values_list('email', 'username')
+        for email, username in existing:
+            if username == data['username']:
+                errors['username'] = "A user with that username already exists."
+            if email.lower() == data['email']:
+                errors['email'] = "A user with this email already exists."
+        
+        if errors:
+            raise serializers.ValidationError(errors)
         return data
     
     def create(self, validated_data):
@@ -112,17 +126,20 @@ class UserSerializer(serializers.ModelSerializer):
         # Remove password_confirm from validated data
         validated_data.pop('password_confirm', None)
         
-        # Create user with encrypted password
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password'],
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', '')
-        )
-        
-        # Create authentication token for the user
-        Token.objects.create(user=user)
+        # Create the user and token in a single transaction
+        with transaction.atomic():
+            # Create user with encrypted password
+            user = User.objects.create_user(
+                username=validated_data['username'],
+                email=validated_data['email'],
+                password=validated_data['password'],
+                first_name=validated_data.get('first_name', ''),
+                last_name=validated_data.get('last_name', '')
+            )
+            
+            # Create authentication token for the user
+            # (also caches it on user.auth_token)
+            Token.objects.create(user=user)
         
         return user
 
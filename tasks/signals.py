@@ -0,0 +1,53 @@
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Task
+
+
+# Cache settings for per-user task statistics and list counts
+TASK_STATS_CACHE_TIMEOUT = 30  # seconds
+TASK_COUNT_CACHE_TIMEOUT = 30  # seconds
+
+
+def task_stats_cache_key(user_id):
+    """Build the cache key for a user's task statistics"""
+    return f'user:{user_id}:taskstats'
+
+
+def task_count_version_key(user_id):
+    """
+    Build the cache key holding the version of a user's cached list counts.
+    Counts are cached per filter combination, so bumping the version is
+    how all of them get invalidated at once.
+    """
+    return f'user:{user_id}:taskcount:version'
+
+
+def task_count_cache_key(user_id, filters_hash):
+    """Build the cache key for a user's task count under given filters"""
+    # Seed with the current time so a culled version key can never come
+    # back as a version that older count entries were written under
+    version = cache.get_or_set(
+        task_count_version_key(user_id), time.time_ns, None
+    )
+    return f'user:{user_id}:taskcount:{version}:{filters_hash}'
+
+
+def invalidate_task_stats(user_id):
+    """Drop the cached task statistics and list counts for a user"""
+    cache.delete(task_stats_cache_key(user_id))
+    try:
+        cache.incr(task_count_version_key(user_id))
+    except ValueError:
+        pass  # No counts cached for this user yet
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def clear_task_stats(sender, instance, **kwargs):
+    """
+    Invalidate the owner's cached statistics whenever a task changes
+    """
+    invalidate_task_stats(instance.user_id)
@@ -1,3 +1,307 @@
-from django.test import TestCase
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from .admin import TaskAdmin
+from .models import Task
+from .renderers import ORJSONRenderer
+
+
+class TaskStatsCacheTests(APITestCase):
+    """
+    Tests for the cached statistics returned by the profile endpoint
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='alice', email='alice@example.com', password='secret123'
+        )
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.task = Task.objects.create(user=self.user, title='First task')
+    
+    def get_stats(self):
+        """Fetch the statistics block from the profile endpoint"""
+        response = self.client.get(reverse('user-profile'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['statistics']
+    
+    def test_stats_are_served_from_cache(self):
+        self.get_stats()
+        # Only the token authentication query should run on a cache hit
+        with self.assertNumQueries(1):
+            stats = self.get_stats()
+        self.assertEqual(stats['total_tasks'], 1)
+    
+    def test_save_invalidates_stats(self):
+        self.assertEqual(self.get_stats()['total_tasks'], 1)
+        Task.objects.create(user=self.user, title='Second task')
+        self.assertEqual(self.get_stats()['total_tasks'], 2)
+    
+    def test_delete_invalidates_stats(self):
+        self.assertEqual(self.get_stats()['total_tasks'], 1)
+        self.task.delete()
+        self.assertEqual(self.get_stats()['total_tasks'], 0)
+    
+    def test_complete_action_invalidates_stats(self):
+        self.assertEqual(self.get_stats()['completed_tasks'], 0)
+        response = self.client.post(
+            reverse('task-complete', args=[self.task.pk])
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = self.get_stats()
+        self.assertEqual(stats['pending_tasks'], 0)
+        self.assertEqual(stats['completed_tasks'], 1)
+    
+    def test_admin_update_status_invalidates_stats(self):
+        self.assertEqual(self.get_stats()['completed_tasks'], 0)
+        task_admin = TaskAdmin(Task, admin.site)
+        updated = task_admin.update_status(
+            Task.objects.filter(pk=self.task.pk), 'completed'
+        )
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.get_stats()['completed_tasks'], 1)
+
+
+class UserRegistrationTests(APITestCase):
+    """
+    Tests for the uniqueness checks performed during registration
+    """
+    def setUp(self):
+        User.objects.create_user(
+            username='alice', email='alice@example.com', password='secret123'
+        )
+    
+    def register(self, **overrides):
+        """Post a registration request with valid defaults"""
+        data = {
+            'username': 'bob',
+            'email': 'bob@example.com',
+            'password': 'secret123',
+            'password_confirm': 'secret123',
+        }
+        data.update(overrides)
+        return self.client.post(reverse('user-register'), data, format='json')
+    
+    def test_register_creates_user_and_token(self):
+        response = self.register()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(username='bob')
+        self.assertEqual(response.data['token'], user.auth_token.key)
+    
+    def test_duplicate_username_is_rejected(self):
+        response = self.register(username='alice')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'username'})
+        self.assertEqual(User.objects.filter(username='alice').count(), 1)
+    
+    def test_duplicate_email_is_rejected_case_insensitively(self):
+        response = self.register(email='Alice@Example.COM')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'email'})
+        self.assertFalse(User.objects.filter(username='bob').exists())
+    
+    def test_all_errors_are_reported_together(self):
+        response = self.register(
+            username='alice',
+            email='ALICE@example.com',
+            password_confirm='different123'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            set(response.data), {'username', 'email', 'password_confirm'}
+        )
+
+
+class CachedCountPaginationTests(APITestCase):
+    """
+    Tests for the cached counts used when paginating task lists
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='alice', email='alice@example.com', password='secret123'
+        )
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        # One more task than fits on a page
+        for i in range(11):
+            Task.objects.create(user=self.user, title=f'Task {i}')
+    
+    def get_count(self, url):
+        """Fetch a task list and return its total count"""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['count']
+    
+    def count_queries(self, url):
+        """Return the COUNT(*) queries issued while fetching a task list"""
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        return [q['sql'] for q in context.captured_queries if 'COUNT(' in q['sql']]
+    
+    def test_count_skips_user_join(self):
+        list_url = reverse('task-list')
+        count_sql = self.count_queries(list_url)
+        self.assertEqual(len(count_sql), 1)
+        self.assertNotIn('auth_user', count_sql[0])
+        # The page rows still carry the annotated username
+        response = self.client.get(list_url)
+        self.assertEqual(
+            {task['username'] for task in response.data['results']},
+            {'alice'}
+        )
+    
+    def test_next_page_reuses_cached_count(self):
+        list_url = reverse('task-list')
+        self.assertEqual(len(self.count_queries(list_url)), 1)
+        self.assertEqual(self.count_queries(f'{list_url}?page=2'), [])
+    
+    def test_count_refreshes_after_create(self):
+        list_url = reverse('task-list')
+        self.assertEqual(self.get_count(list_url), 11)
+        response = self.client.post(list_url, {'title': 'New task'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get_count(list_url), 12)
+    
+    def test_count_refreshes_after_complete(self):
+        pending_url = reverse('task-pending')
+        self.assertEqual(self.get_count(pending_url), 11)
+        task = Task.objects.first()
+        self.client.post(reverse('task-complete', args=[task.pk]))
+        self.assertEqual(self.get_count(pending_url), 10)
+        self.assertEqual(self.get_count(reverse('task-completed')), 1)
+    
+    def test_count_refreshes_after_delete(self):
+        list_url = reverse('task-list')
+        self.assertEqual(self.get_count(list_url), 11)
+        task = Task.objects.first()
+        self.client.delete(reverse('task-detail', args=[task.pk]))
+        self.assertEqual(self.get_count(list_url), 10)
+    
+    def test_filters_do_not_share_cached_counts(self):
+        Task.objects.filter(title='Task 0').update(status='completed')
+        list_url = reverse('task-list')
+        self.assertEqual(self.get_count(f'{list_url}?status=pending'), 10)
+        self.assertEqual(self.get_count(f'{list_url}?status=completed'), 1)
+        self.assertEqual(self.get_count(f'{list_url}?search=Task 1'), 2)
+        self.assertEqual(self.get_count(f'{list_url}?search=Task 2'), 1)
+    
+    def test_overdue_counts_are_not_cached(self):
+        task = Task.objects.first()
+        Task.objects.filter(pk=task.pk).update(
+            due_date=timezone.now() + timedelta(hours=1)
+        )
+        overdue_url = reverse('task-overdue')
+        filter_url = f"{reverse('task-list')}?overdue=true"
+        self.assertEqual(self.get_count(overdue_url), 0)
+        self.assertEqual(self.get_count(filter_url), 0)
+        # Becoming overdue involves no write that would fire a signal
+        Task.objects.filter(pk=task.pk).update(
+            due_date=timezone.now() - timedelta(hours=1)
+        )
+        response = self.client.get(overdue_url)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(self.get_count(filter_url), 1)
+
+
+class TaskListFilterTests(APITestCase):
+    """
+    Tests for the overdue filter and the list-style task actions
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='alice', email='alice@example.com', password='secret123'
+        )
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        now = timezone.now()
+        self.overdue = Task.objects.create(
+            user=self.user, title='Overdue', due_date=now - timedelta(days=1)
+        )
+        self.upcoming = Task.objects.create(
+            user=self.user, title='Upcoming', due_date=now + timedelta(days=1)
+        )
+        self.undated = Task.objects.create(user=self.user, title='Undated')
+        self.done = Task.objects.create(
+            user=self.user, title='Done', status='completed',
+            due_date=now - timedelta(days=1)
+        )
+    
+    def get_ids(self, url):
+        """Fetch a task list and return the ids of the returned tasks"""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {task['id'] for task in response.data['results']}
+    
+    def test_overdue_true_filter(self):
+        ids = self.get_ids(f"{reverse('task-list')}?overdue=true")
+        self.assertEqual(ids, {self.overdue.id})
+    
+    def test_overdue_false_filter_includes_undated_tasks(self):
+        ids = self.get_ids(f"{reverse('task-list')}?overdue=false")
+        self.assertEqual(ids, {self.upcoming.id, self.undated.id, self.done.id})
+    
+    def test_overdue_action_matches_filter(self):
+        self.assertEqual(
+            self.get_ids(reverse('task-overdue')),
+            self.get_ids(f"{reverse('task-list')}?overdue=true")
+        )
+    
+    def test_pending_action_is_paginated(self):
+        response = self.client.get(reverse('task-pending'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data), {'count', 'next', 'previous', 'results'}
+        )
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            {task['id'] for task in response.data['results']},
+            {self.overdue.id, self.upcoming.id, self.undated.id}
+        )
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    Tests that ORJSONRenderer produces the same output as DRF's JSONRenderer
+    """
+    def assertRendersLikeDRF(self, data):
+        """Check both renderers produce equivalent JSON for `data`"""
+        expected = json.loads(JSONRenderer().render(data))
+        actual = json.loads(ORJSONRenderer().render(data))
+        self.assertEqual(actual, expected)
+        return actual
+    
+    def test_aware_datetime_uses_z_suffix(self):
+        value = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc)
+        data = self.assertRendersLikeDRF({'due_date': value})
+        self.assertEqual(data['due_date'], '2024-01-02T03:04:05.123456Z')
+    
+    def test_falls_back_to_drf_encoder(self):
+        data = self.assertRendersLikeDRF({
+            'amount': Decimal('1.50'),
+            'label': gettext_lazy('Pending'),
+        })
+        self.assertEqual(data, {'amount': 1.5, 'label': 'Pending'})
+    
+    def test_non_str_keys(self):
+        data = self.assertRendersLikeDRF({'tags': {1: ['Not a valid string.']}})
+        self.assertEqual(data, {'tags': {'1': ['Not a valid string.']}})
+    
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
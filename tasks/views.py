@@ -7,9 +7,18 @@ from rest_framework.authtoken.models import Token
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.core.cache import cache
+from django.http import Http404
+from django.utils import timezone
+from django.db.models import Count, F, Q
 from .models import Task
+from .filters import TaskFilter, overdue_q
 from .serializers import TaskSerializer, UserSerializer, AuthTokenSerializer
+from .signals import (
+    task_stats_cache_key,
+    invalidate_task_stats,
+    TASK_STATS_CACHE_TIMEOUT
+)
 
 
 class TaskViewSet(viewsets.ModelViewSet):
@@ -23,8 +32,8 @@ class TaskViewSet(viewsets.ModelViewSet):
     # Enable filtering, searching, and ordering
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     
-    # Fields that can be used for filtering
-    filterset_fields = ['status', 'due_date']
+    # Fields that can be used for filtering (status, due_date, overdue)
+    filterset_class = TaskFilter
     
     # Fields that can be searched
     search_fields = ['title', 'description']
@@ -33,68 +42,112 @@ class TaskViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'due_date', 'status']
     ordering = ['-created_at']  # Default ordering
     
+    # Actions returning task lists; the paginator annotates their rows
+    # one page at a time (see annotate_page)
+    list_actions = ['list', 'pending', 'completed', 'overdue']
+    
     def get_queryset(self):
         """
-        Filter tasks to only show tasks belonging to the authenticated user
+        Filter tasks to only show tasks belonging to the authenticated user.
+        On reads the owner's username is annotated so serializing it doesn't
+        query per task. Paginated lists leave that to annotate_page() so
+        COUNT(*) skips the user join; writes skip it entirely.
+        IsAuthenticated guarantees a logged-in user here.
+        """
+        queryset = Task.objects.filter(user_id=self.request.user.id)
+        if self.action == 'retrieve' or (
+            self.action in self.list_actions and self.paginator is None
+        ):
+            queryset = self.annotate_page(queryset)
+        return queryset
+    
+    def annotate_page(self, queryset):
+        """
+        Annotate the owner's username onto a (possibly sliced) task queryset
         """
-        if self.request.user.is_authenticated:
-            return Task.objects.filter(user=self.request.user)
-        return Task.objects.none()
+        return queryset.annotate(username=F('user__username'))
     
     def perform_create(self, serializer):
         """
         Automatically set the user field to the current authenticated user
         when creating a new task
         """
-        serializer.save(user=self.request.user)
+        task = serializer.save(user=self.request.user)
+        # Writes don't use the annotated queryset, so set username directly
+        task.username = self.request.user.username
     
     def perform_update(self, serializer):
         """
         Ensure the user field cannot be changed during update
         """
-        serializer.save(user=self.request.user)
+        task = serializer.save(user=self.request.user)
+        task.username = self.request.user.username
+    
+    def list_response(self, queryset):
+        """
+        Paginate and serialize a task queryset the same way list() does,
+        for actions that narrow the filtered list further
+        """
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+    
+    # The actions below are kept for existing clients; they are thin
+    # wrappers over the list query and equivalent to the noted parameters.
     
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """
-        Custom action to get only pending tasks for the current user
+        Custom action to get only pending tasks (same as ?status=pending)
         """
-        pending_tasks = self.get_queryset().filter(status='pending')
-        serializer = self.get_serializer(pending_tasks, many=True)
-        return Response(serializer.data)
+        pending_tasks = self.filter_queryset(self.get_queryset())
+        return self.list_response(pending_tasks.filter(status='pending'))
     
     @action(detail=False, methods=['get'])
     def completed(self, request):
         """
-        Custom action to get only completed tasks for the current user
+        Custom action to get only completed tasks (same as ?status=completed)
         """
-        completed_tasks = self.get_queryset().filter(status='completed')
-        serializer = self.get_serializer(completed_tasks, many=True)
-        return Response(serializer.data)
+        completed_tasks = self.filter_queryset(self.get_queryset())
+        return self.list_response(completed_tasks.filter(status='completed'))
     
     @action(detail=False, methods=['get'])
     def overdue(self, request):
         """
-        Custom action to get overdue tasks for the current user
+        Custom action to get overdue tasks (same as ?overdue=true)
         """
-        from django.utils import timezone
-        overdue_tasks = self.get_queryset().filter(
-            due_date__lt=timezone.now(),
-            status='pending'
-        )
-        serializer = self.get_serializer(overdue_tasks, many=True)
-        return Response(serializer.data)
+        overdue_tasks = self.filter_queryset(self.get_queryset())
+        return self.list_response(overdue_tasks.filter(overdue_q()))
     
     @action(detail=True, methods=['post'])
     def complete(self, request, pk=None):
         """
-        Custom action to mark a task as completed
+        Custom action to mark a task as completed.
+        Issues a single UPDATE instead of loading and saving the task.
         """
-        task = self.get_object()
-        task.status = 'completed'
-        task.save()
-        serializer = self.get_serializer(task)
-        return Response(serializer.data)
+        now = timezone.now()
+        try:
+            updated = Task.objects.filter(pk=pk, user_id=request.user.id).update(
+                status='completed',
+                updated_at=now
+            )
+        except (TypeError, ValueError):
+            updated = 0  # Malformed primary key
+        
+        if not updated:
+            raise Http404
+        
+        # Bulk updates bypass signals, so invalidate cached stats manually
+        invalidate_task_stats(request.user.id)
+        
+        return Response({
+            'id': int(pk),
+            'status': 'completed',
+            'updated_at': now
+        })
     
     def destroy(self, request, *args, **kwargs):
         """
@@ -125,8 +178,8 @@ class UserRegistrationView(APIView):
             # Create the user
             user = serializer.save()
             
-            # Get or create token for the user
-            token, created = Token.objects.get_or_create(user=user)
+            # Token was created (and cached) by the serializer
+            token = user.auth_token
             
             # Return user data with token
             return Response({
@@ -164,8 +217,11 @@ class UserLoginView(APIView):
             # Get the authenticated user from serializer
             user = serializer.validated_data['user']
             
-            # Get or create token for the user
-            token, created = Token.objects.get_or_create(user=user)
+            # Look up the existing token first (the common case), falling
+            # back to get_or_create only when the user has none
+            token = Token.objects.filter(user=user).first()
+            if token is None:
+                token, created = Token.objects.get_or_create(user=user)
             
             # Return user data with token
             return Response({
@@ -197,18 +253,12 @@ class UserLogoutView(APIView):
         """
         Handle POST request for user logout
         """
-        try:
-            # Delete the user's token
-            request.user.auth_token.delete()
-            return Response(
-                {'message': 'Logout successful'},
-                status=status.HTTP_200_OK
-            )
-        except:
-            return Response(
-                {'error': 'Error during logout'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Delete the user's token with a single DELETE (no-op if none exists)
+        Token.objects.filter(user=request.user).delete()
+        return Response(
+            {'message': 'Logout successful'},
+            status=status.HTTP_200_OK
+        )
 
 
 class UserProfileView(APIView):
@@ -222,9 +272,18 @@ class UserProfileView(APIView):
         Get current user's profile information
         """
         user = request.user
-        task_count = user.tasks.count()
-        pending_tasks = user.tasks.filter(status='pending').count()
-        completed_tasks = user.tasks.filter(status='completed').count()
+        
+        # Serve statistics from cache when available
+        cache_key = task_stats_cache_key(user.id)
+        stats = cache.get(cache_key)
+        if stats is None:
+            # Compute all task counts in a single query
+            stats = user.tasks.aggregate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(status='pending')),
+                completed=Count('id', filter=Q(status='completed'))
+            )
+            cache.set(cache_key, stats, TASK_STATS_CACHE_TIMEOUT)
         
         return Response({
             'user': {
@@ -236,9 +295,9 @@ class UserProfileView(APIView):
                 'date_joined': user.date_joined
             },
             'statistics': {
-                'total_tasks': task_count,
-                'pending_tasks': pending_tasks,
-                'completed_tasks': completed_tasks
+                'total_tasks': stats['total'],
+                'pending_tasks': stats['pending'],
+                'completed_tasks': stats['completed']
             }
         })
 